@@ -1,29 +1,72 @@
 # -*- coding: utf-8 -*-
 
+import os
 import re
+import sys
+import functools
 import warnings
-from collections import namedtuple
+from types import MappingProxyType
+
+if os.environ.get('CROMULENT_USE_REGEX'):
+	# The third-party regex module can optimize finite alternations better
+	# than the stdlib engine; opt-in only, so default behavior is unchanged
+	try:
+		import regex as re
+	except ImportError:
+		pass
+from dataclasses import dataclass
 from contextlib import contextmanager
+from typing import Optional
 
 import locale
 import calendar
 from contextlib import contextmanager, suppress
 from datetime import datetime, timedelta
 
+try:
+	import hyperscan
+except ImportError:
+	hyperscan = None
+
+try:
+	import numpy
+	from numba import njit
+except ImportError:
+	numpy = None
+	njit = None
+
 from cromulent import model, vocab
 
 #mark - Mapping Dictionaries
 
 # TODO: can this be refactored somewhere?
-CURRENCY_MAPPING = {
-	'österreichische schilling': 'at shillings',
-	'florins': 'de florins',
-	'fl': 'de florins',
-	'fl.': 'de florins',
-	'pounds': 'gb pounds',
-	'livres': 'fr livres',
-	'guineas': 'gb guineas',
-	'reichsmark': 'de reichsmarks'
+# Read-only, with interned keys and values so the per-record lookups compare
+# by pointer rather than re-hashing the full strings
+CURRENCY_MAPPING = MappingProxyType({
+	sys.intern(k): sys.intern(v) for k, v in {
+		'österreichische schilling': 'at shillings',
+		'florins': 'de florins',
+		'fl': 'de florins',
+		'fl.': 'de florins',
+		'pounds': 'gb pounds',
+		'livres': 'fr livres',
+		'guineas': 'gb guineas',
+		'reichsmark': 'de reichsmarks'
+	}.items()
+})
+
+# Pre-resolved vocab instances for the unit and currency keys hit on hot
+# paths, so repeated records don't re-hash the same strings against the full
+# vocab.instances dict. Keys not covered here fall back to vocab.instances.
+_UNIT_VOCAB = {
+	k: vocab.instances[k]
+	for k in ('inches', 'feet', 'cm', 'fr_inches', 'fr_feet', 'ligne')
+	if k in vocab.instances
+}
+_CURRENCY_VOCAB = {
+	v: vocab.instances[v]
+	for v in set(CURRENCY_MAPPING.values())
+	if v in vocab.instances
 }
 
 #mark - Dimensions
@@ -39,12 +82,12 @@ NUMBER_PATTERN = r'((?:\d+\s+\d+/\d+)|(?:\d+/\d+)|(?:\d+(?:[.,]\d+)?))'
 UNIT_PATTERN = r'''('|"|d(?:[.]?|uymen)|pouc[e.]s?|in(?:ch(?:es)?|[.]?)|'''\
 				r'''pieds?|v[.]?|voeten|f(?:eet|oot|t[.]?)|cm|lignes?|linges?)'''
 DIMENSION_PATTERN = '(%s\\s*(?:%s)?)' % (NUMBER_PATTERN, UNIT_PATTERN)
-DIMENSION_RE = re.compile(r'\s*%s' % (DIMENSION_PATTERN,))
+DIMENSION_RE = re.compile(r'\s*%s' % (DIMENSION_PATTERN,), re.ASCII)
 
 SIMPLE_WIDTH_HEIGHT_PATTERN = r'(?:\s*((?<!\w)[wh]|width|height))?'
 SIMPLE_DIMENSIONS_PATTERN_X1 = ''\
 	r'(?P<d1>(?:%s\s*)+)(?P<d1w>%s)' % (DIMENSION_PATTERN, SIMPLE_WIDTH_HEIGHT_PATTERN)
-SIMPLE_DIMENSIONS_RE_X1 = re.compile(SIMPLE_DIMENSIONS_PATTERN_X1)
+SIMPLE_DIMENSIONS_RE_X1 = re.compile(SIMPLE_DIMENSIONS_PATTERN_X1, re.ASCII)
 SIMPLE_DIMENSIONS_PATTERN_X2a = ''\
 	r'(?P<d1>(?:%s\s*)+)(?P<d1w>%s)'\
 	r'(?:,)?\s*(x|by)'\
@@ -61,44 +104,48 @@ SIMPLE_DIMENSIONS_PATTERN_X2b = ''\
 		DIMENSION_PATTERN,
 		SIMPLE_WIDTH_HEIGHT_PATTERN,
 		DIMENSION_PATTERN)
-SIMPLE_DIMENSIONS_RE_X2a = re.compile(SIMPLE_DIMENSIONS_PATTERN_X2a)
-SIMPLE_DIMENSIONS_RE_X2b = re.compile(SIMPLE_DIMENSIONS_PATTERN_X2b)
+SIMPLE_DIMENSIONS_RE_X2a = re.compile(SIMPLE_DIMENSIONS_PATTERN_X2a, re.ASCII)
+SIMPLE_DIMENSIONS_RE_X2b = re.compile(SIMPLE_DIMENSIONS_PATTERN_X2b, re.ASCII)
 
 # Haut 14 pouces, large 10 pouces
 FRENCH_DIMENSIONS_PATTERN = r'[Hh](?:(?:aut(?:eur|[.])?)|[.])\s*(?P<d1>(?:%s\s*)+),? '\
 							r'[Ll](?:(?:arge?(?:ur|[.])?)|[.])\s*(?P<d2>(?:%s\s*)+)' % (
 								DIMENSION_PATTERN, DIMENSION_PATTERN)
-FRENCH_DIMENSIONS_RE = re.compile(FRENCH_DIMENSIONS_PATTERN)
+FRENCH_DIMENSIONS_RE = re.compile(FRENCH_DIMENSIONS_PATTERN, re.ASCII)
 
 # Hoog. 1 v. 6 d., Breed 2 v. 3 d.
 DUTCH_DIMENSIONS_PATTERN = r'(?P<d1w>[Hh]oogh?[.]?|[Bb]reedt?) (?P<d1>(?:%s\s*)+), '\
 							r'(?P<d2w>[Hh]oogh?[.]?|[Bb]reedt?) (?P<d2>(?:%s\s*)+)' % (
 								DIMENSION_PATTERN, DIMENSION_PATTERN)
-DUTCH_DIMENSIONS_RE = re.compile(DUTCH_DIMENSIONS_PATTERN)
+DUTCH_DIMENSIONS_RE = re.compile(DUTCH_DIMENSIONS_PATTERN, re.ASCII)
 
-Dimension = namedtuple("Dimension", [
-	'value',	# numeric value
-	'unit',		# unit
-	'which'		# e.g. width, height, ...
-])
+# Cheap pre-filter for dimensions_cleaner: every dimension pattern requires at
+# least one digit, so strings without one can be rejected with a single scan
+HAS_DIGIT_RE = re.compile(r'\d', re.ASCII)
+
+@dataclass(frozen=True, slots=True)
+class Dimension:
+	value: float			# numeric value
+	unit: Optional[str]		# unit
+	which: Optional[str]	# e.g. width, height, ...
 
 def _canonical_value(value):
 	try:
-		value = value.replace(',', '.')
-		parts = value.split(None, 1)
-		if len(parts) > 1 and '/' in parts[1]:
-			intpart = int(parts[0])
-			numer, denom = map(int, parts[1].split('/', 1))
-			fracpart = float(numer)/denom
-			value = str(intpart + fracpart)
-		elif len(parts) == 1 and '/' in parts[0]:
-			intpart = 0
-			numer, denom = map(int, parts[0].split('/', 1))
-			fracpart = float(numer)/denom
-			value = str(intpart + fracpart)
-		if value.startswith('.'):
-			value = '0' + value
-		
+		if ',' in value:
+			value = value.replace(',', '.')
+		if '/' in value:
+			# "8 1/2" or "1/2"; compute the fraction directly rather than
+			# round-tripping the sum through a string
+			parts = value.split(None, 1)
+			if len(parts) > 1 and '/' in parts[1]:
+				intpart = int(parts[0])
+				numer, denom = map(int, parts[1].split('/', 1))
+			elif len(parts) == 1:
+				intpart = 0
+				numer, denom = map(int, parts[0].split('/', 1))
+			else:
+				return None
+			return intpart + float(numer)/denom
 		try:
 			return int(value)
 		except ValueError:
@@ -107,38 +154,36 @@ def _canonical_value(value):
 		pass
 	return None
 
+# Canonical unit for each (lowercased) unit token that UNIT_PATTERN can match
+CANONICAL_UNITS = {
+	'pouces': 'fr_inches', 'pouce': 'fr_inches', 'pouc.': 'fr_inches',
+	'pieds': 'fr_feet', 'pied': 'fr_feet',
+	'ligne': 'ligne', 'lignes': 'ligne', 'linge': 'ligne', 'linges': 'ligne',
+	'in': 'inches', 'in.': 'inches', 'inch': 'inches', 'inches': 'inches',
+	'duymen': 'inches', 'd.': 'inches', 'd': 'inches', '"': 'inches',
+	'ft': 'feet', 'ft.': 'feet', 'feet': 'feet', 'foot': 'feet',
+	'voeten': 'feet', 'v.': 'feet', 'v': 'feet', "'": 'feet',
+	'cm': 'cm'
+}
+
+CANONICAL_WHICH = {
+	'w': 'width',
+	'h': 'height'
+}
+
 def _canonical_unit(value):
-	inches = {'duymen', 'd.', 'd', '"'}
-	feet = {'pieds', 'pied', 'feet', 'foot', 'voeten', 'v.', 'v', "'"}
-	fr_inches = {'pouces', 'pouce', 'pouc.'}
-	fr_feet = {'pieds', 'pied'}
-	if value is None:
+	if not value:
 		return None
-	value = value.lower()
-	if value in fr_inches:
-		return 'fr_inches'
-	if value in fr_feet:
-		return 'fr_feet'
-	if 'ligne' in value or 'linge' in value:
-		return 'ligne'
-	if 'in' in value or value in inches:
-		return 'inches'
-	if 'ft' in value or value in feet:
-		return 'feet'
-	if 'cm' in value:
-		return 'cm'
-	return None
+	return CANONICAL_UNITS.get(value.lower())
 
 def _canonical_which(value):
 	if not value:
 		return None
 	value = value.strip().lower()
-	if value.startswith('w'):
-		return 'width'
-	if value.startswith('h'):
-		return 'height'
-	warnings.warn('*** Unknown which dimension: %s' % (value,))
-	return None
+	which = CANONICAL_WHICH.get(value[:1])
+	if which is None and __debug__:
+		warnings.warn('*** Unknown which dimension: %s' % (value,))
+	return which
 
 def parse_simple_dimensions(value, which=None):
 	'''
@@ -153,30 +198,46 @@ def parse_simple_dimensions(value, which=None):
 	'''
 	if value is None:
 		return None
-	value = value.strip()
+	dims = _parse_simple_dimensions_cached(value.strip(), which)
+	if dims is None:
+		return None
+	return list(dims)
+
+@functools.lru_cache(maxsize=65536)
+def _parse_simple_dimensions_cached(value, which):
+	'''
+	Cached implementation of `parse_simple_dimensions`, keyed on the stripped
+	string. Dimension strings in catalog data are highly repetitive, so most
+	calls are cache hits. Returns a tuple (hashable) or None; the public
+	function converts back to a fresh list. Note that the `warnings.warn`
+	calls here fire only on the first parse of a given string.
+	'''
 	dims = []
 # 	warnings.warn('DIMENSION: %s' % (value,))
 
+	canonical_value = _canonical_value
+	canonical_unit = _canonical_unit
+	which = _canonical_which(which)
 	last_unit = None
-	for match in re.finditer(DIMENSION_RE, value):
-		# warnings.warn('--> match %s' % (match,))
-		matched_value = _canonical_value(match.group(2))
+	# findall yields plain (dimension, number, unit) tuples for the capture
+	# groups, avoiding a Match object allocation per dimension token
+	for _, number_value, unit_value in DIMENSION_RE.findall(value):
+		matched_value = canonical_value(number_value)
 		if not matched_value:
-			warnings.warn('*** failed to canonicalize dimension value: %s' % (match.group(2),))
+			if __debug__:
+				warnings.warn('*** failed to canonicalize dimension value: %s' % (number_value,))
 			return None
-		unit_value = match.group(3)
-		matched_unit = _canonical_unit(unit_value)
+		matched_unit = canonical_unit(unit_value)
 		if matched_unit is None:
 			matched_unit = NEXT_FINER_DIMENSION_UNIT.get(last_unit)
-		if unit_value and not matched_unit:
+		if unit_value and not matched_unit and __debug__:
 			warnings.warn('*** not a recognized unit: %s' % (unit_value,))
-		which = _canonical_which(which)
 		dim = Dimension(value=matched_value, unit=matched_unit, which=which)
 		last_unit = matched_unit
 		dims.append(dim)
 	if not dims:
 		return None
-	return dims
+	return tuple(dims)
 
 def normalized_dimension_object(dimensions, source=None, **kwargs):
 	'''
@@ -199,36 +260,98 @@ def normalized_dimension_object(dimensions, source=None, **kwargs):
 			"10 feet, 3 inches"
 		)
 	'''
-	normalized = normalize_dimension(dimensions, source=source, **kwargs)
+	normalized = _normalize_and_label(dimensions, source=source, **kwargs)
 	if not normalized:
 		return None
-	labels = []
-	for dim in dimensions:
-		if dim.unit == 'inches':
-			units = ('inch', 'inches')
-		elif dim.unit == 'feet':
-			units = ('foot', 'feet')
-		elif dim.unit == 'fr_feet':
-			units = ('French foot', 'French feet')
-		elif dim.unit == 'fr_inches':
-			units = ('French inch', 'French inches')
-		elif dim.unit == 'cm':
-			units = ('cm', 'cm')
-		elif dim.unit == 'ligne':
-			units = ('ligne', 'lignes')
-		elif dim.unit is None:
-			units = ('', '')
-		else:
-			warnings.warn('*** unrecognized unit: {dim.unit}')
-			return None
-		unit = units[0] if (float(dim.value) == 1.0) else units[1]
-		if unit:
-			label = '%s %s' % (dim.value, unit)
+	dimension, labels = normalized
+	return dimension, ', '.join(labels)
+
+# Integer codes for the recognized units, used by the numeric reduction kernel
+UNIT_CODES = {
+	'inches': 0,
+	'feet': 1,
+	'cm': 2,
+	'fr_feet': 3,
+	'fr_inches': 4,
+	'ligne': 5,
+	None: 6
+}
+
+def _reduce_dimension_values(values, codes):
+	'''
+	Sum the raw dimension `values` (classified by the parallel `UNIT_CODES`
+	entries in `codes`) into per-system accumulators. Returns a tuple of
+	(inches, fr_inches, cm, unknown, used), where `used` is a bitmask of the
+	measurement systems seen (1=imperial, 2=French, 4=metric, 8=unknown).
+
+	This is a pure numeric loop, so it is JIT-compiled when numba is
+	available; otherwise it runs as ordinary Python.
+	'''
+	inches = 0.0
+	fr_inches = 0.0
+	centimeters = 0.0
+	unknown = 0.0
+	used = 0
+	for i in range(len(values)):
+		code = codes[i]
+		value = values[i]
+		if code == 0:
+			inches += value
+			used |= 1
+		elif code == 1:
+			inches += 12.0 * value
+			used |= 1
+		elif code == 2:
+			centimeters += value
+			used |= 4
+		elif code == 3:
+			fr_inches += 12.0 * value
+			used |= 2
+		elif code == 4:
+			fr_inches += value
+			used |= 2
+		elif code == 5:
+			fr_inches += value / 12.0
+			used |= 2
 		else:
-			label = str(dim.value)
-		labels.append(label)
-	label = ', '.join(labels)
-	return normalized, label
+			unknown += value
+			used |= 8
+	return inches, fr_inches, centimeters, unknown, used
+
+if njit is not None:
+	_reduce_dimension_values = njit(cache=True)(_reduce_dimension_values)
+
+def _reduce_dimension_groups(offsets, values, codes):
+	'''
+	Batched form of `_reduce_dimension_values`: `values` and `codes` hold the
+	dimensions of many groups back to back, with group `i` occupying
+	`values[offsets[i]:offsets[i+1]]` (CSR-style). Returns one row of
+	(inches, fr_inches, cm, unknown, used) per group.
+
+	When numba is available, the numpy variant below replaces this and
+	reduces every group in a single compiled call.
+	'''
+	results = []
+	for i in range(len(offsets) - 1):
+		start, end = offsets[i], offsets[i + 1]
+		results.append(_reduce_dimension_values(values[start:end], codes[start:end]))
+	return results
+
+if njit is not None:
+	@njit(cache=True)
+	def _reduce_dimension_groups(offsets, values, codes):
+		count = offsets.shape[0] - 1
+		out = numpy.zeros((count, 5), dtype=numpy.float64)
+		for i in range(count):
+			start, end = offsets[i], offsets[i + 1]
+			inches, fr_inches, centimeters, unknown, used = \
+				_reduce_dimension_values(values[start:end], codes[start:end])
+			out[i, 0] = inches
+			out[i, 1] = fr_inches
+			out[i, 2] = centimeters
+			out[i, 3] = unknown
+			out[i, 4] = used
+		return out
 
 def normalize_dimension(dimensions, source=None):
 	'''
@@ -237,53 +360,77 @@ def normalize_dimension(dimensions, source=None):
 
 	If the values cannot be sensibly combined (e.g. inches + centimeters), returns `None`.
 	'''
-	unknown = 0
-	inches = 0
-	fr_inches = 0
-	centimeters = 0
-	used_unknown = False
-	used_inches = False
-	used_fr_inches = False
-	used_centimeters = False
+	normalized = _normalize_and_label(dimensions, source=source)
+	if not normalized:
+		return None
+	return normalized[0]
+
+def _normalize_and_label(dimensions, source=None):
+	'''
+	Walk `dimensions` once, accumulating both the inputs to the numeric
+	reduction kernel and the per-dimension display labels. Returns a tuple of
+	the normalized `Dimension` and the list of labels, or `None` if the
+	dimensions cannot be sensibly combined.
+	'''
+	values = []
+	codes = []
+	labels = []
 	which = None
 	for dim in dimensions:
 		which = dim.which
-		if dim.unit == 'inches':
-			inches += dim.value
-			used_inches = True
-		elif dim.unit == 'feet':
-			inches += 12 * dim.value
-			used_inches = True
-		elif dim.unit == 'cm':
-			centimeters += dim.value
-			used_centimeters = True
-		elif dim.unit == 'fr_feet':
-			fr_inches += 12.0 * dim.value
-			used_fr_inches = True
-		elif dim.unit == 'fr_inches':
-			fr_inches += dim.value
-			used_fr_inches = True
-		elif dim.unit == 'ligne':
-			fr_inches += dim.value / 12.0
-			used_fr_inches = True
-		elif dim.unit is None:
-			unknown += dim.value
-			used_unknown = True
-		else:
-			warnings.warn('*** unrecognized unit: %s' % (dim.unit,))
+		code = UNIT_CODES.get(dim.unit, -1)
+		if code < 0:
+			if __debug__:
+				warnings.warn('*** unrecognized unit: %s' % (dim.unit,))
 			return None
+		labels.append(_dimension_label(dim))
+		values.append(float(dim.value))
+		codes.append(code)
+	if numpy is not None:
+		values = numpy.asarray(values, dtype=numpy.float64)
+		codes = numpy.asarray(codes, dtype=numpy.int8)
+	inches, fr_inches, centimeters, unknown, used = _reduce_dimension_values(values, codes)
+	normalized = _select_normalized(
+		inches, fr_inches, centimeters, unknown, used,
+		which, dimensions, source)
+	if normalized is None:
+		return None
+	return normalized, labels
+
+# Preformatted (singular, plural) label suffixes for each recognized unit;
+# units have already been validated against UNIT_CODES by the time labels
+# are built
+UNIT_LABELS = {
+	'inches': (' inch', ' inches'),
+	'feet': (' foot', ' feet'),
+	'fr_feet': (' French foot', ' French feet'),
+	'fr_inches': (' French inch', ' French inches'),
+	'cm': (' cm', ' cm'),
+	'ligne': (' ligne', ' lignes'),
+	None: ('', '')
+}
 
-	used_systems = 0
-	for used in (used_inches, used_fr_inches, used_centimeters, used_unknown):
-		if used:
-			used_systems += 1
-	if used_systems != 1:
-		if source:
-			warnings.warn('*** dimension used a mix of metric, imperial, and/or unknown: '\
-							'%r; source is %r' % (dimensions, source))
-		else:
-			warnings.warn('*** dimension used a mix of metric, imperial, and/or unknown: '\
-							'%r' % (dimensions,))
+def _dimension_label(dim):
+	'''Format a single (already unit-validated) `Dimension` for display.'''
+	suffixes = UNIT_LABELS[dim.unit]
+	suffix = suffixes[0] if (float(dim.value) == 1.0) else suffixes[1]
+	return str(dim.value) + suffix
+
+def _select_normalized(inches, fr_inches, centimeters, unknown, used, which, dimensions, source):
+	'''
+	Turn the accumulators produced by the reduction kernel into a single
+	normalized `Dimension`, or `None` (with a warning) if the input used no
+	units at all or mixed measurement systems.
+	'''
+	if used == 0 or (used & (used - 1)) != 0:
+		# no units at all, or more than one measurement system
+		if __debug__:
+			if source:
+				warnings.warn('*** dimension used a mix of metric, imperial, and/or unknown: '\
+								'%r; source is %r' % (dimensions, source))
+			else:
+				warnings.warn('*** dimension used a mix of metric, imperial, and/or unknown: '\
+								'%r' % (dimensions,))
 		return None
 	if fr_inches:
 		return Dimension(value=fr_inches, unit='fr_inches', which=which)
@@ -293,6 +440,31 @@ def normalize_dimension(dimensions, source=None):
 		return Dimension(value=centimeters, unit='cm', which=which)
 	return Dimension(value=unknown, unit=None, which=which)
 
+# Constructors resolved once at import rather than through attribute chains on
+# every record; the vocab classes are created when cromulent.vocab is imported
+# and are not replaced afterwards
+_DIMENSION_CLASSES = {
+	'height': vocab.Height,
+	'width': vocab.Width,
+	None: vocab.PhysicalDimension
+}
+_NAME = model.Name
+
+def _physical_dimension_object(dimension, label):
+	'''
+	Build the model object for a normalized `Dimension` and its display label.
+	'''
+	cls = _DIMENSION_CLASSES.get(dimension.which, vocab.PhysicalDimension)
+	dim = cls(ident='')
+	dim.value = dimension.value
+	dim.identified_by = _NAME(ident='', content=label)
+	unit = _UNIT_VOCAB.get(dimension.unit)
+	if unit is None and dimension.unit is not None:
+		unit = vocab.instances.get(dimension.unit)
+	if unit:
+		dim.unit = unit
+	return dim
+
 def extract_physical_dimensions(dimstr, **kwargs):
 	dimensions = dimensions_cleaner(dimstr, **kwargs)
 	if dimensions:
@@ -300,18 +472,65 @@ def extract_physical_dimensions(dimstr, **kwargs):
 			dimdata = normalized_dimension_object(orig_d, source=dimstr)
 			if dimdata:
 				dimension, label = dimdata
-				if dimension.which == 'height':
-					dim = vocab.Height(ident='')
-				elif dimension.which == 'width':
-					dim = vocab.Width(ident='')
-				else:
-					dim = vocab.PhysicalDimension(ident='')
-				dim.value = dimension.value
-				dim.identified_by = model.Name(ident='', content=label)
-				unit = vocab.instances.get(dimension.unit)
-				if unit:
-					dim.unit = unit
-				yield dim
+				yield _physical_dimension_object(dimension, label)
+
+def extract_physical_dimensions_batch(dimstrs, **kwargs):
+	'''
+	Batch-oriented version of `extract_physical_dimensions` for bulk ingestion.
+
+	Parses every string in `dimstrs` up front, accumulating the parsed
+	dimensions into flat parallel arrays, reduces all of them with a single
+	call to `_reduce_dimension_groups` (one compiled call when numba is
+	available), and then builds the model objects. Returns a list containing,
+	for each input string, a list of dimension model objects (possibly empty).
+	'''
+	offsets = [0]
+	values = []
+	codes = []
+	groups = []
+	results = []
+	for dimstr in dimstrs:
+		objects = []
+		results.append(objects)
+		dimensions = dimensions_cleaner(dimstr, **kwargs)
+		if not dimensions:
+			continue
+		for orig_d in dimensions:
+			which = None
+			labels = []
+			bad_unit = False
+			for dim in orig_d:
+				which = dim.which
+				code = UNIT_CODES.get(dim.unit, -1)
+				if code < 0:
+					if __debug__:
+						warnings.warn('*** unrecognized unit: %s' % (dim.unit,))
+					bad_unit = True
+					break
+				labels.append(_dimension_label(dim))
+				values.append(float(dim.value))
+				codes.append(code)
+			if bad_unit:
+				del values[offsets[-1]:]
+				del codes[offsets[-1]:]
+				continue
+			offsets.append(len(values))
+			groups.append((objects, which, labels, orig_d, dimstr))
+	if numpy is not None:
+		reduced = _reduce_dimension_groups(
+			numpy.asarray(offsets, dtype=numpy.int64),
+			numpy.asarray(values, dtype=numpy.float64),
+			numpy.asarray(codes, dtype=numpy.int8))
+	else:
+		reduced = _reduce_dimension_groups(offsets, values, codes)
+	for (objects, which, labels, orig_d, dimstr), row in zip(groups, reduced):
+		inches, fr_inches, centimeters, unknown, used = row
+		normalized = _select_normalized(
+			inches, fr_inches, centimeters, unknown, int(used),
+			which, orig_d, dimstr)
+		if normalized is not None:
+			objects.append(_physical_dimension_object(normalized, ', '.join(labels)))
+	return results
 
 def dimensions_cleaner(value, default_unit=None):
 	'''
@@ -322,13 +541,10 @@ def dimensions_cleaner(value, default_unit=None):
 	'''
 	if value is None:
 		return None
-	cleaners = [
-		simple_dimensions_cleaner_x2,
-		french_dimensions_cleaner_x2,
-		dutch_dimensions_cleaner_x2,
-		simple_dimensions_cleaner_x1
-	]
-	for cleaner in cleaners:
+	if not HAS_DIGIT_RE.search(value):
+		# no digit means no dimension; skip the cleaners entirely
+		return None
+	for cleaner in _candidate_cleaners(value):
 		dimensions = cleaner(value)
 		if dimensions:
 			if default_unit:
@@ -339,43 +555,56 @@ def dimensions_cleaner(value, default_unit=None):
 			return dimensions
 	return None
 
+def _simple_whichs(groups):
+	'''The which hints come from the captured `d1w`/`d2w` groups.'''
+	return (groups.get('d1w'), groups.get('d2w'))
+
+def _french_whichs(groups):
+	'''French-formatted strings always give height first, then width.'''
+	return ('h', 'w')
+
+def _dutch_whichs(groups):
+	'''Dutch-formatted strings may give the dimensions in either order.'''
+	height, width = 'h', 'w'
+	if 'breed' in groups['d1w'].lower():
+		height, width = width, height
+	return (height, width)
+
+def _clean_dimensions(value, pattern, whichs_fn, arity):
+	'''
+	Shared implementation of the dimension cleaners: match `pattern` against
+	`value` and parse each of the `arity` captured dimension groups, with the
+	which hints supplied by `whichs_fn`. Returns a tuple of `arity` dimension
+	lists, or None.
+	'''
+	match = pattern.match(value)
+	if match is None:
+		return None
+	groups = match.groupdict()
+	whichs = whichs_fn(groups)
+	dims = []
+	for i in range(arity):
+		dims.append(parse_simple_dimensions(groups['d%d' % (i + 1,)], whichs[i]))
+	if all(dims):
+		return tuple(dims)
+	if arity > 1 and __debug__:
+		for i, dim in enumerate(dims):
+			warnings.warn('dim%d: %s %s %s' % (i + 1, dim, groups['d%d' % (i + 1,)], whichs[i]))
+		warnings.warn('*** Failed to parse dimensions: %s' % (value,))
+	return None
+
 def french_dimensions_cleaner_x2(value):
 	'''Attempt to parse 2 dimensions from a French-formatted string.'''
 	# Haut 14 pouces, large 10 pouces
 
-	match = FRENCH_DIMENSIONS_RE.match(value)
-	if match:
-		groups = match.groupdict()
-		dim1 = parse_simple_dimensions(groups['d1'], 'h')
-		dim2 = parse_simple_dimensions(groups['d2'], 'w')
-		if dim1 and dim2:
-			return (dim1, dim2)
-		warnings.warn('dim1: %s %s h' % (dim1, groups['d1']))
-		warnings.warn('dim2: %s %s w' % (dim2, groups['d2']))
-		warnings.warn('*** Failed to parse dimensions: %s' % (value,))
-	return None
+	return _clean_dimensions(value, FRENCH_DIMENSIONS_RE, _french_whichs, 2)
 
 def dutch_dimensions_cleaner_x2(value):
 	'''Attempt to parse 2 dimensions from a Dutch-formatted string.'''
 	# Hoog. 1 v. 6 d., Breed 2 v. 3 d.
 	# Breedt 6 v., hoog 3 v
 
-	match = DUTCH_DIMENSIONS_RE.match(value)
-	if match:
-		groups = match.groupdict()
-		height = 'h'
-		width = 'w'
-		if 'breed' in groups['d1w'].lower():
-			height, width = width, height
-
-		dim1 = parse_simple_dimensions(groups['d1'], height)
-		dim2 = parse_simple_dimensions(groups['d2'], width)
-		if dim1 and dim2:
-			return (dim1, dim2)
-		warnings.warn('dim1: %s %s h' % (dim1, groups['d1']))
-		warnings.warn('dim2: %s %s w' % (dim2, groups['d2']))
-		warnings.warn('*** Failed to parse dimensions: %s' % (value,))
-	return None
+	return _clean_dimensions(value, DUTCH_DIMENSIONS_RE, _dutch_whichs, 2)
 
 def simple_dimensions_cleaner_x1(value):
 	'''Attempt to parse 1 dimension from a string.'''
@@ -383,13 +612,7 @@ def simple_dimensions_cleaner_x1(value):
 	# 1' 2"
 	# 1 ft. 2 in. h
 
-	match = SIMPLE_DIMENSIONS_RE_X1.match(value)
-	if match:
-		groups = match.groupdict()
-		dim1 = parse_simple_dimensions(groups['d1'], groups['d1w'])
-		if dim1:
-			return (dim1,)
-	return None
+	return _clean_dimensions(value, SIMPLE_DIMENSIONS_RE_X1, _simple_whichs, 1)
 
 def simple_dimensions_cleaner_x2(value):
 	'''Attempt to parse 2 dimensions from a string.'''
@@ -398,20 +621,80 @@ def simple_dimensions_cleaner_x2(value):
 	# 1 ft. 2 in. h by 3 cm w
 
 	for pattern in (SIMPLE_DIMENSIONS_RE_X2a, SIMPLE_DIMENSIONS_RE_X2b):
-		match = pattern.match(value)
-		if match:
-			groups = match.groupdict()
-			dim1 = parse_simple_dimensions(groups['d1'], groups['d1w'])
-			dim2 = parse_simple_dimensions(groups['d2'], groups['d2w'])
-			if dim1 and dim2:
-				return (dim1, dim2)
-			warnings.warn('dim1: %s %s %s' % (dim1, groups['d1'], groups['d1w']))
-			warnings.warn('dim2: %s %s %s' % (dim2, groups['d2'], groups['d2w']))
-			warnings.warn('*** Failed to parse dimensions: %s' % (value,))
+		dims = _clean_dimensions(value, pattern, _simple_whichs, 2)
+		if dims:
+			return dims
 	return None
 
+# The cleaners tried by `dimensions_cleaner`, in priority order
+DIMENSION_CLEANERS = (
+	simple_dimensions_cleaner_x2,
+	french_dimensions_cleaner_x2,
+	dutch_dimensions_cleaner_x2,
+	simple_dimensions_cleaner_x1
+)
+
+def _compile_hyperscan_prefilter():
+	'''
+	Compile all of the dimension patterns into a single hyperscan database that can
+	scan a string once and report which of the cleaners in `DIMENSION_CLEANERS`
+	can possibly match it. The patterns are compiled as prefilters, since hyperscan
+	does not support all of the constructs they use (e.g. lookbehind); a prefilter
+	hit is then confirmed by running only the corresponding cleaner.
+
+	Returns None if hyperscan is not installed, or if compilation fails.
+	'''
+	if hyperscan is None:
+		return None
+	expressions = (
+		# (pattern, index into DIMENSION_CLEANERS)
+		(SIMPLE_DIMENSIONS_PATTERN_X2a, 0),
+		(SIMPLE_DIMENSIONS_PATTERN_X2b, 0),
+		(FRENCH_DIMENSIONS_PATTERN, 1),
+		(DUTCH_DIMENSIONS_PATTERN, 2),
+		(SIMPLE_DIMENSIONS_PATTERN_X1, 3),
+	)
+	try:
+		db = hyperscan.Database()
+		db.compile(
+			expressions=[p.encode('utf-8') for p, _ in expressions],
+			ids=[i for _, i in expressions],
+			flags=[hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions)
+		)
+		return db
+	except Exception:
+		return None
+
+HYPERSCAN_DB = _compile_hyperscan_prefilter()
+
+def _candidate_cleaners(value):
+	'''
+	Return the cleaners that can possibly match `value`, in priority order.
+
+	If the hyperscan prefilter is available, the string is scanned once and only
+	the cleaners whose pattern reported a (possible) match are returned; otherwise
+	all of `DIMENSION_CLEANERS` are returned.
+	'''
+	if HYPERSCAN_DB is None:
+		return DIMENSION_CLEANERS
+	matched = set()
+	def on_match(ident, start, end, flags, context):
+		matched.add(ident)
+	try:
+		HYPERSCAN_DB.scan(value.encode('utf-8'), match_event_handler=on_match)
+	except Exception:
+		return DIMENSION_CLEANERS
+	return [c for i, c in enumerate(DIMENSION_CLEANERS) if i in matched]
+
 #mark - Monetary Values
 
+# '[?]' or '?' qualifiers that may be attached to a price amount
+PRICE_QUALIFIER_RE = re.compile(r'\[\?\]|\?')
+# a comma followed by three digits, i.e. a thousands separator
+THOUSANDS_SEPARATOR_RE = re.compile(r',\d\d\d')
+# a price amount that float() is guaranteed to accept
+NUMERIC_PRICE_RE = re.compile(r'[-+]?(?:\d+(?:\.\d*)?|\.\d+)$', re.ASCII)
+
 def extract_monetary_amount(data, add_citations=False, currency_mapping=CURRENCY_MAPPING, source_mapping=None):
 	'''
 	Returns a `MonetaryAmount`, `StartingPrice`, or `EstimatedPrice` object
@@ -471,32 +754,31 @@ def extract_monetary_amount(data, add_citations=False, currency_mapping=CURRENCY
 			amnt.referred_to_by = vocab.Note(ident='', content=note)
 
 		if price_amount:
-			try:
-				value = price_amount
-				value = value.replace('[?]', '')
-				value = value.replace('?', '')
-				value = value.strip()
-				if re.search(re.compile(r',\d\d\d'), value):
-					value = value.replace(',', '')
+			value = PRICE_QUALIFIER_RE.sub('', price_amount).strip()
+			if THOUSANDS_SEPARATOR_RE.search(value):
+				value = value.replace(',', '')
+			if NUMERIC_PRICE_RE.match(value):
 				value = float(value)
 				price_amount_label = '{:,}'.format(round(value, 3))
 				amnt.value = value
-			except ValueError:
+			else:
 				amnt._label = price_amount
 				amnt.identified_by = model.Name(ident='', content=price_amount)
 	# 			warnings.warn(f'*** Not a numeric price amount: {value}')
 		if price_currency:
 			price_currency_key = price_currency
-			try:
-				price_currency_key = currency_mapping[price_currency_key.lower()]
-			except KeyError:
-				pass
+			if isinstance(price_currency_key, str):
+				price_currency_key = currency_mapping.get(price_currency_key.lower(), price_currency_key)
 			if isinstance(price_currency_key, model.BaseResource):
 				amnt.currency = price_currency_key
-			elif price_currency_key in vocab.instances:
-				amnt.currency = vocab.instances[price_currency_key]
 			else:
-				warnings.warn('*** No currency instance defined for %s' % (price_currency_key,))
+				currency = _CURRENCY_VOCAB.get(price_currency_key)
+				if currency is None:
+					currency = vocab.instances.get(price_currency_key)
+				if currency is not None:
+					amnt.currency = currency
+				elif __debug__:
+					warnings.warn('*** No currency instance defined for %s' % (price_currency_key,))
 		if price_amount_label and price_currency:
 			amnt._label = '%s %s' % (price_amount_label, price_currency)
 		elif price_amount:
@@ -156,6 +156,27 @@ class TestDimensionExtraction(unittest.TestCase):
 				self.assertEqual(got.type, expected.type)
 				self.assertEqual(got.unit, expected.unit)
 
+	def test_extract_physical_dimensions_batch(self):
+		'''
+		Test that `cromulent.extract.extract_physical_dimensions_batch` returns
+		the same data as `cromulent.extract.extract_physical_dimensions` for
+		each input string.
+		'''
+		values = [
+			'hauteur 9 pouces, largeur 7',
+			'2 in by 1 in',
+			'unknown',
+			'h 38 cm, w 27 cm',
+		]
+		expected = [list(cromulent.extract.extract_physical_dimensions(v)) for v in values]
+		got = cromulent.extract.extract_physical_dimensions_batch(values)
+		self.assertEqual(len(got), len(expected))
+		for got_dims, expected_dims in zip(got, expected):
+			self.assertEqual(len(got_dims), len(expected_dims))
+			for g, e in zip(got_dims, expected_dims):
+				self.assertEqual(g.value, e.value)
+				self.assertEqual(g.type, e.type)
+
 	def test_normalize_dimension(self):
 		tests = {
 			'1 ft, 2 in': ('1 foot, 2 inches', Dimension(value=14, unit='inches', which=None)),